@@ -1,17 +1,120 @@
 
+import re
+import asyncio
+from itertools import groupby
+from operator import attrgetter
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple, Union
 from datetime import datetime
 
-from bot.models import QuestRank, QuestCategory, QuestStatus
+from bot.models import Quest, QuestRank, QuestCategory, QuestStatus, ProgressStatus
 from bot.quest_manager import QuestManager
 from bot.config import ChannelConfig
 from bot.user_stats import UserStatsManager
 from bot.permissions import has_quest_creation_permission, can_manage_quest, user_has_required_roles
 
 
+class _TitleMap(dict):
+    """Display titles keyed by stored value, falling back to str.title() for unknown values"""
+
+    def __missing__(self, key: str) -> str:
+        return key.title()
+
+
+_RANK_COLORS = {
+    QuestRank.EASY: discord.Color.green(),
+    QuestRank.NORMAL: discord.Color.blue(),
+    QuestRank.MEDIUM: discord.Color.orange(),
+    QuestRank.HARD: discord.Color.red(),
+    QuestRank.IMPOSSIBLE: discord.Color.purple()
+}
+
+_DEFAULT_COLOR = discord.Color.light_grey()
+
+_ROLE_MENTION_RE = re.compile(r'<@&(\d+)>')
+
+# Discord's limit on the combined text of all embeds in a single message
+_MESSAGE_EMBEDS_MAX_CHARS = 6000
+
+# Display order for /my_quests status groups
+_PROGRESS_STATUS_ORDER = (
+    ProgressStatus.ACCEPTED,
+    ProgressStatus.COMPLETED,
+    ProgressStatus.APPROVED,
+    ProgressStatus.REJECTED
+)
+
+_STATUS_KEY = attrgetter("status")
+
+# Leaderboard labels for the top three places
+_RANK_INDICATORS = ("**[CHAMPION]**", "**[ELITE]**", "**[VETERAN]**")
+
+# (field name, purpose) for each channel reported by /setup_channels, in parameter order
+_SETUP_CHANNEL_FIELDS = (
+    ("Quest List Channel", "New quests will be posted here"),
+    ("Quest Accept Channel", "Use this channel to accept quests"),
+    ("Quest Submit Channel", "Submit completed quests here"),
+    ("Quest Approval Channel", "Quest approvals will be processed here"),
+    ("Notification Channel", "General quest notifications will appear here")
+)
+
+# Static /help embed in Discord's payload shape; help_command builds from a copy
+_HELP_EMBED_DICT = {
+    "title": "Quest Bot Command Guide",
+    "description": "**Complete guide to managing quests in your server**",
+    "color": discord.Color.blue().value,
+    "fields": [
+        {
+            "name": "■ Server Setup",
+            "value": "```yaml\n/setup_channels - Configure quest channels for your server\n```",
+            "inline": False
+        },
+        {
+            "name": "■ Quest Creation & Management",
+            "value": "```yaml\n/create_quest - Create a new quest\n/delete_quest - Delete a quest (creators only)\n```",
+            "inline": False
+        },
+        {
+            "name": "■ Quest Participation",
+            "value": "```yaml\n/list_quests - View available quests\n/quest_info - Get detailed quest information\n/accept_quest - Accept a quest\n/submit_quest - Submit completed quest\n```",
+            "inline": False
+        },
+        {
+            "name": "■ Quest Review",
+            "value": "```yaml\n/approve_quest - Approve a completed quest\n/reject_quest - Reject a completed quest\n```",
+            "inline": False
+        },
+        {
+            "name": "■ Progress & Statistics",
+            "value": "```yaml\n/my_quests - View your quest progress\n/leaderboard - View server leaderboard\n```",
+            "inline": False
+        },
+        {
+            "name": "■ Quest Difficulty Levels",
+            "value": "**Easy** → **Normal** → **Medium** → **Hard** → **Impossible**",
+            "inline": True
+        },
+        {
+            "name": "■ Available Categories",
+            "value": "**Hunting** • **Gathering** • **Collecting** • **Crafting**\n**Exploration** • **Combat** • **Social** • **Building**\n**Trading** • **Puzzle** • **Survival** • **Other**",
+            "inline": True
+        }
+    ],
+    "footer": {"text": "Need additional help? Contact your server administrators • Bot developed for quest management"}
+}
+
+_STATUS_TITLES = _TitleMap({
+    QuestStatus.AVAILABLE: "Available",
+    QuestStatus.ACCEPTED: "Accepted",
+    QuestStatus.COMPLETED: "Completed",
+    QuestStatus.APPROVED: "Approved",
+    QuestStatus.REJECTED: "Rejected",
+    QuestStatus.CANCELLED: "Cancelled"
+})
+
+
 class QuestCommands(commands.Cog):
     """Quest command handlers"""
 
@@ -22,29 +125,185 @@ class QuestCommands(commands.Cog):
         self.quest_manager = quest_manager
         self.channel_config = channel_config
         self.user_stats_manager = user_stats_manager
+        # Strong references to fire-and-forget tasks so they aren't garbage collected
+        self._bg_tasks: Set[asyncio.Task] = set()
 
     def _get_rank_color(self, rank: str) -> discord.Color:
         """Get color based on quest rank"""
-        colors = {
-            QuestRank.EASY: discord.Color.green(),
-            QuestRank.NORMAL: discord.Color.blue(),
-            QuestRank.MEDIUM: discord.Color.orange(),
-            QuestRank.HARD: discord.Color.red(),
-            QuestRank.IMPOSSIBLE: discord.Color.purple()
-        }
-        return colors.get(rank, discord.Color.light_grey())
-
-    def _get_status_color(self, status: str) -> discord.Color:
-        """Get color based on quest status"""
-        colors = {
-            QuestStatus.AVAILABLE: discord.Color.green(),
-            QuestStatus.ACCEPTED: discord.Color.yellow(),
-            QuestStatus.COMPLETED: discord.Color.orange(),
-            QuestStatus.APPROVED: discord.Color.blue(),
-            QuestStatus.REJECTED: discord.Color.red(),
-            QuestStatus.CANCELLED: discord.Color.dark_grey()
-        }
-        return colors.get(status, discord.Color.light_grey())
+        return _RANK_COLORS.get(rank, _DEFAULT_COLOR)
+
+    def _build_quest_embed(self, quest: Quest, guild: discord.Guild, title: str, description: str,
+                           summary_fields: List[Tuple[str, str]],
+                           requirements_name: str = "■ Requirements",
+                           reward_name: str = "■ Reward",
+                           show_required_roles: bool = True) -> discord.Embed:
+        """Build the quest embed layout shared by the create, info and accept views"""
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=self._get_rank_color(quest.rank)
+        )
+
+        # Quest info section followed by the view-specific inline fields
+        embed.add_field(
+            name="■ Quest Information",
+            value=f"**Quest ID:** `{quest.quest_id}`\n**Difficulty:** {quest.rank_display}\n**Category:** {quest.category_display}",
+            inline=True
+        )
+        for name, value in summary_fields:
+            embed.add_field(name=name, value=value, inline=True)
+
+        if quest.requirements:
+            embed.add_field(
+                name=requirements_name,
+                value=f"```yaml\n{quest.requirements}\n```",
+                inline=False
+            )
+
+        if quest.reward:
+            embed.add_field(
+                name=reward_name,
+                value=f"```yaml\n{quest.reward}\n```",
+                inline=False
+            )
+
+        if show_required_roles and quest.required_role_ids:
+            get_role = guild.get_role
+            role_mentions = [role.mention for role in map(get_role, quest.required_role_ids) if role]
+            if role_mentions:
+                embed.add_field(
+                    name="■ Required Roles",
+                    value=" ".join(role_mentions),
+                    inline=False
+                )
+
+        return embed
+
+    async def _reply_private(self, interaction: discord.Interaction, message: str):
+        """Reply with an ephemeral message, even after the interaction was publicly deferred"""
+        if not interaction.response.is_done():
+            await interaction.response.send_message(message, ephemeral=True)
+            return
+
+        # The first followup after a public defer would inherit its visibility,
+        # so drop the deferred response and send the message as a fresh followup
+        await interaction.delete_original_response()
+        await interaction.followup.send(message, ephemeral=True)
+
+    async def _require_managed_quest(self, interaction: discord.Interaction, quest_id: str,
+                                     action: str) -> Optional[Quest]:
+        """Fetch a quest the invoking user may manage, replying privately with the reason if not"""
+        quest = await self.quest_manager.get_quest(quest_id)
+        if not quest:
+            await self._reply_private(interaction, "Quest not found!")
+            return None
+
+        if not can_manage_quest(interaction.user, interaction.guild, quest.creator_id):
+            await self._reply_private(interaction, f"You don't have permission to {action} this quest!")
+            return None
+
+        return quest
+
+    def _run_in_background(self, coro):
+        """Schedule a coroutine as a task, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+    async def _notify_quest_approved(self, destination: Union[discord.abc.Messageable, discord.Webhook],
+                                     quest: Quest, user: discord.Member, approver: discord.Member, now: datetime):
+        """Send the approval notice to the user who completed the quest"""
+        user_embed = discord.Embed(
+            title="🎉 Quest Approved!",
+            description=f"Congratulations! Your completion of **{quest.title}** has been approved!",
+            color=discord.Color.green()
+        )
+
+        user_embed.add_field(
+            name="■ Quest Details",
+            value=quest.details_block,
+            inline=True
+        )
+
+        user_embed.add_field(
+            name="■ Approved By",
+            value=f"{approver.mention}\n**{approver.display_name}**",
+            inline=True
+        )
+
+        user_embed.add_field(
+            name="■ Approved On",
+            value=f"<t:{int(now.timestamp())}:f>",
+            inline=True
+        )
+
+        if quest.reward:
+            user_embed.add_field(
+                name="■ Your Reward",
+                value=f"```yaml\n{quest.reward}\n```",
+                inline=False
+            )
+
+        user_embed.add_field(
+            name="■ Congratulations!",
+            value="Well done on completing this quest! Your efforts have been recognized and rewarded.",
+            inline=False
+        )
+
+        user_embed.set_footer(text=f"Quest ID: {quest.quest_id} • Keep up the great work!")
+        user_embed.timestamp = now
+
+        try:
+            await destination.send(content=f"{user.mention} 🎉", embed=user_embed)
+        except discord.HTTPException as e:
+            print(f"Failed to notify user {user.id} about approved quest {quest.quest_id}: {e}")
+
+    async def _notify_quest_rejected(self, destination: Union[discord.abc.Messageable, discord.Webhook],
+                                     quest: Quest, user: discord.Member, approver: discord.Member, now: datetime):
+        """Send the rejection notice to the user who completed the quest"""
+        user_embed = discord.Embed(
+            title="❌ Quest Rejected",
+            description=f"Your submission for **{quest.title}** has been rejected and requires revision.",
+            color=discord.Color.red()
+        )
+
+        user_embed.add_field(
+            name="■ Quest Details",
+            value=quest.details_block,
+            inline=True
+        )
+
+        user_embed.add_field(
+            name="■ Rejected By",
+            value=f"{approver.mention}\n**{approver.display_name}**",
+            inline=True
+        )
+
+        user_embed.add_field(
+            name="■ Rejected On",
+            value=f"<t:{int(now.timestamp())}:f>",
+            inline=True
+        )
+
+        user_embed.add_field(
+            name="■ What's Next",
+            value="• Review the quest requirements carefully\n• You can attempt this quest again after 24 hours\n• Make sure your proof meets all the specified criteria\n• Contact the quest creator if you need clarification",
+            inline=False
+        )
+
+        user_embed.add_field(
+            name="■ Don't Give Up!",
+            value="Learning from feedback is part of the adventure. Use this as an opportunity to improve and try again!",
+            inline=False
+        )
+
+        user_embed.set_footer(text=f"Quest ID: {quest.quest_id} • Try again in 24 hours")
+        user_embed.timestamp = now
+
+        try:
+            await destination.send(content=f"{user.mention} 📋", embed=user_embed)
+        except discord.HTTPException as e:
+            print(f"Failed to notify user {user.id} about rejected quest {quest.quest_id}: {e}")
 
     @app_commands.command(name="setup_channels", description="Setup quest channels for the server")
     @app_commands.describe(
@@ -71,45 +330,25 @@ class QuestCommands(commands.Cog):
             color=discord.Color.green()
         )
         
-        embed.add_field(
-            name="Quest List Channel",
-            value=f"{quest_list_channel.mention}\nNew quests will be posted here",
-            inline=False
-        )
-        embed.add_field(
-            name="Quest Accept Channel",
-            value=f"{quest_accept_channel.mention}\nUse this channel to accept quests",
-            inline=False
-        )
-        embed.add_field(
-            name="Quest Submit Channel",
-            value=f"{quest_submit_channel.mention}\nSubmit completed quests here",
-            inline=False
-        )
-        embed.add_field(
-            name="Quest Approval Channel",
-            value=f"{quest_approval_channel.mention}\nQuest approvals will be processed here",
-            inline=False
-        )
-        embed.add_field(
-            name="Notification Channel",
-            value=f"{notification_channel.mention}\nGeneral quest notifications will appear here",
-            inline=False
-        )
+        configured = (quest_list_channel, quest_accept_channel, quest_submit_channel,
+                      quest_approval_channel, notification_channel)
+        for (name, purpose), channel in zip(_SETUP_CHANNEL_FIELDS, configured):
+            embed.add_field(name=name, value=f"{channel.mention}\n{purpose}", inline=False)
 
         embed.set_footer(text=f"Configured by {interaction.user.display_name}")
-        embed.timestamp = datetime.now()
-
-        await interaction.response.send_message(embed=embed)
-
-        # Set channels in database after responding
-        await self.channel_config.set_guild_channels(
-            interaction.guild.id,
-            quest_list_channel.id,
-            quest_accept_channel.id,
-            quest_submit_channel.id,
-            quest_approval_channel.id,
-            notification_channel.id
+        embed.timestamp = discord.utils.utcnow()
+
+        # Store the channels while the confirmation is being sent
+        await asyncio.gather(
+            interaction.response.send_message(embed=embed),
+            self.channel_config.set_guild_channels(
+                interaction.guild.id,
+                quest_list_channel.id,
+                quest_accept_channel.id,
+                quest_submit_channel.id,
+                quest_approval_channel.id,
+                notification_channel.id
+            )
         )
 
     @app_commands.command(name="create_quest", description="Create a new quest")
@@ -162,10 +401,8 @@ class QuestCommands(commands.Cog):
         # Parse required roles
         required_role_ids = []
         if required_roles:
-            import re
             # Extract role IDs from mentions
-            role_mention_pattern = r'<@&(\d+)>'
-            role_ids = re.findall(role_mention_pattern, required_roles)
+            role_ids = _ROLE_MENTION_RE.findall(required_roles)
             for role_id in role_ids:
                 role = interaction.guild.get_role(int(role_id))
                 if role:
@@ -174,8 +411,10 @@ class QuestCommands(commands.Cog):
             # If no mentions found, try parsing as role names
             if not required_role_ids:
                 role_names = [name.strip() for name in required_roles.split(',')]
+                # Reversed so duplicate names resolve to the first match, as discord.utils.get did
+                roles_by_name = {role.name: role for role in reversed(interaction.guild.roles)}
                 for role_name in role_names:
-                    role = discord.utils.get(interaction.guild.roles, name=role_name)
+                    role = roles_by_name.get(role_name)
                     if role:
                         required_role_ids.append(role.id)
 
@@ -192,69 +431,30 @@ class QuestCommands(commands.Cog):
         )
 
         # Create beautiful quest embed for quest list channel
-        public_embed = discord.Embed(
+        public_embed = self._build_quest_embed(
+            quest,
+            interaction.guild,
             title="NEW QUEST AVAILABLE",
             description=f"**{quest.title}**",
-            color=self._get_rank_color(quest.rank)
-        )
-        
-        public_embed.add_field(
+            summary_fields=[
+                ("■ Status", f"**{_STATUS_TITLES[quest.status]}**\n*Ready to Accept*"),
+                # Empty field for spacing
+                ("\u200b", "\u200b")
+            ]
+        )
+        public_embed.insert_field_at(
+            0,
             name="■ Description",
             value=f"```\n{quest.description}\n```",
             inline=False
         )
         
-        # Quest info section with better formatting
-        quest_info = f"**Quest ID:** `{quest.quest_id}`\n**Difficulty:** {quest.rank.title()}\n**Category:** {quest.category.title()}"
-        public_embed.add_field(
-            name="■ Quest Information",
-            value=quest_info,
-            inline=True
-        )
-        
-        # Status indicator
-        public_embed.add_field(
-            name="■ Status",
-            value=f"**{quest.status.title()}**\n*Ready to Accept*",
-            inline=True
-        )
-        
-        # Empty field for spacing
-        public_embed.add_field(name="\u200b", value="\u200b", inline=True)
-        
-        if quest.requirements:
-            public_embed.add_field(
-                name="■ Requirements",
-                value=f"```yaml\n{quest.requirements}\n```",
-                inline=False
-            )
-        
-        if quest.reward:
-            public_embed.add_field(
-                name="■ Reward",
-                value=f"```yaml\n{quest.reward}\n```",
-                inline=False
-            )
-        
-        if quest.required_role_ids:
-            role_mentions = []
-            for role_id in quest.required_role_ids:
-                role = interaction.guild.get_role(role_id)
-                if role:
-                    role_mentions.append(role.mention)
-            if role_mentions:
-                public_embed.add_field(
-                    name="■ Required Roles",
-                    value=" ".join(role_mentions),
-                    inline=False
-                )
-        
         # Add acceptance instructions
-        accept_channel = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
-        if accept_channel:
+        channels = await self.channel_config.get_channels(interaction.guild.id)
+        if channels.quest_accept_channel:
             public_embed.add_field(
                 name="■ How to Accept This Quest",
-                value=f"Use `/accept_quest {quest.quest_id}` in <#{accept_channel}>",
+                value=f"Use `/accept_quest {quest.quest_id}` in <#{channels.quest_accept_channel}>",
                 inline=False
             )
         else:
@@ -266,7 +466,7 @@ class QuestCommands(commands.Cog):
         
         public_embed.set_author(
             name=f"Quest Creator: {interaction.user.display_name}",
-            icon_url=interaction.user.display_avatar.url if interaction.user.display_avatar else None
+            icon_url=interaction.user.display_avatar.url
         )
         
         public_embed.set_footer(
@@ -283,18 +483,18 @@ class QuestCommands(commands.Cog):
             color=self._get_rank_color(quest.rank)
         )
         private_embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
-        private_embed.add_field(name="Difficulty", value=quest.rank.title(), inline=True)
-        private_embed.add_field(name="Category", value=quest.category.title(), inline=True)
+        private_embed.add_field(name="Difficulty", value=quest.rank_display, inline=True)
+        private_embed.add_field(name="Category", value=quest.category_display, inline=True)
         private_embed.set_footer(text="Your quest is now live and ready for adventurers to accept.")
 
-        await interaction.followup.send(embed=private_embed)
-
-        # Send to quest list channel
-        quest_list_channel_id = await self.channel_config.get_quest_list_channel(interaction.guild.id)
-        if quest_list_channel_id:
-            quest_list_channel = interaction.guild.get_channel(quest_list_channel_id)
+        # Reply to the creator and post to the quest list channel concurrently
+        sends = [interaction.followup.send(embed=private_embed)]
+        if channels.quest_list_channel:
+            quest_list_channel = interaction.guild.get_channel(channels.quest_list_channel)
             if quest_list_channel:
-                await quest_list_channel.send(embed=public_embed)
+                sends.append(quest_list_channel.send(embed=public_embed))
+
+        await asyncio.gather(*sends)
 
     @app_commands.command(name="list_quests", description="List all available quests")
     @app_commands.describe(
@@ -331,17 +531,16 @@ class QuestCommands(commands.Cog):
         """List all available quests"""
         await interaction.response.defer()
 
-        # Get quests
+        # Get quests, fetching one extra row to detect more than fit on the board
         if show_all:
-            quests = await self.quest_manager.get_guild_quests(interaction.guild.id)
+            quests = await self.quest_manager.get_guild_quests(
+                interaction.guild.id, rank=rank_filter, category=category_filter, limit=11
+            )
         else:
-            quests = await self.quest_manager.get_available_quests(interaction.guild.id)
-
-        # Apply filters
-        if rank_filter:
-            quests = [q for q in quests if q.rank == rank_filter]
-        if category_filter:
-            quests = [q for q in quests if q.category == category_filter]
+            quests = await self.quest_manager.get_available_quests(
+                interaction.guild.id, rank=rank_filter, category=category_filter, limit=11
+            )
+        has_more = len(quests) > 10
 
         if not quests:
             embed = discord.Embed(
@@ -357,10 +556,29 @@ class QuestCommands(commands.Cog):
             await interaction.followup.send(embed=embed)
             return
 
+        # Add quests (limit to 10 for readability)
+        shown_quests = quests[:10]
+        get_member = interaction.guild.get_member
+        creator_names = {}
+        for creator_id in {quest.creator_id for quest in shown_quests}:
+            creator = get_member(creator_id)
+            creator_names[creator_id] = creator.display_name if creator else "Unknown User"
+
+        # One line per quest in the description keeps the board to a single text block
+        lines = [f"**{'10+' if has_more else len(quests)}** quest{'s' if len(quests) != 1 else ''} found", ""]
+        for quest in shown_quests:
+            title = quest.title[:100] + '...' if len(quest.title) > 100 else quest.title
+            line = (f"`{quest.quest_id}` **{title}** — {quest.rank_display} / {quest.category_display}"
+                    f" — {_STATUS_TITLES[quest.status]} — {creator_names[quest.creator_id]}")
+            if quest.reward:
+                reward_preview = quest.reward[:40] + '...' if len(quest.reward) > 40 else quest.reward
+                line += f" — Reward: {reward_preview}"
+            lines.append(line)
+
         # Create paginated quest list
         embed = discord.Embed(
             title=f"Quest Board - {interaction.guild.name}",
-            description=f"**{len(quests)}** quest{'s' if len(quests) != 1 else ''} found",
+            description="\n".join(lines),
             color=discord.Color.blue()
         )
 
@@ -382,35 +600,15 @@ class QuestCommands(commands.Cog):
                 inline=False
             )
 
-        # Add quests (limit to 10 for readability)
-        for i, quest in enumerate(quests[:10]):
-            creator = interaction.guild.get_member(quest.creator_id)
-            creator_name = creator.display_name if creator else "Unknown User"
-            
-            # Status indicator without emojis
-            status_text = quest.status.title()
-            
-            quest_info = f"**Difficulty:** {quest.rank.title()}\n**Category:** {quest.category.title()}\n**Creator:** {creator_name}\n**Status:** {status_text}"
-            
-            if quest.reward:
-                reward_preview = quest.reward[:40] + '...' if len(quest.reward) > 40 else quest.reward
-                quest_info += f"\n**Reward:** {reward_preview}"
-
-            embed.add_field(
-                name=f"■ {quest.title}",
-                value=f"```yaml\nID: {quest.quest_id}\n```{quest_info}",
-                inline=True
-            )
-
-        if len(quests) > 10:
+        if has_more:
             embed.add_field(
                 name="■ Additional Information",
-                value=f"Showing first 10 of {len(quests)} quests. Use filters to narrow down results.",
+                value="Showing the 10 newest quests. Use filters to narrow down results.",
                 inline=False
             )
 
         embed.set_footer(text="Use /quest_info <quest_id> to view detailed information • Use /accept_quest <quest_id> to accept a quest")
-        embed.timestamp = datetime.now()
+        embed.timestamp = discord.utils.utcnow()
 
         await interaction.followup.send(embed=embed)
 
@@ -418,97 +616,58 @@ class QuestCommands(commands.Cog):
     @app_commands.describe(quest_id="The ID of the quest")
     async def quest_info(self, interaction: discord.Interaction, quest_id: str):
         """Get detailed information about a specific quest"""
+        await interaction.response.defer()
+
         quest = await self.quest_manager.get_quest(quest_id)
         
         if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
+            await self._reply_private(interaction, "Quest not found!")
             return
 
         # Check if quest is from the same guild
         if quest.guild_id != interaction.guild.id:
-            await interaction.response.send_message("Quest not found in this server!", ephemeral=True)
+            await self._reply_private(interaction, "Quest not found in this server!")
             return
 
-        embed = discord.Embed(
-            title=f"Quest Details: {quest.title}",
-            description=f"```\n{quest.description}\n```",
-            color=self._get_rank_color(quest.rank)
-        )
-
-        # Quest information in a structured format
-        quest_details = f"**Quest ID:** `{quest.quest_id}`\n**Difficulty:** {quest.rank.title()}\n**Category:** {quest.category.title()}"
-        embed.add_field(
-            name="■ Quest Information",
-            value=quest_details,
-            inline=True
-        )
-
-        # Status information
-        status_color = self._get_status_color(quest.status)
-        embed.add_field(
-            name="■ Status",
-            value=f"**{quest.status.title()}**",
-            inline=True
-        )
-
         # Creator info
         creator = interaction.guild.get_member(quest.creator_id)
         creator_name = creator.display_name if creator else "Unknown User"
-        embed.add_field(
-            name="■ Quest Creator",
-            value=f"**{creator_name}**\n*Created {quest.created_at.strftime('%B %d, %Y')}*",
-            inline=True
-        )
-
-        if quest.requirements:
-            embed.add_field(
-                name="■ Requirements",
-                value=f"```yaml\n{quest.requirements}\n```",
-                inline=False
-            )
-
-        if quest.reward:
-            embed.add_field(
-                name="■ Reward",
-                value=f"```yaml\n{quest.reward}\n```",
-                inline=False
-            )
 
-        if quest.required_role_ids:
-            role_mentions = []
-            for role_id in quest.required_role_ids:
-                role = interaction.guild.get_role(role_id)
-                if role:
-                    role_mentions.append(role.mention)
-            if role_mentions:
-                embed.add_field(
-                    name="■ Required Roles",
-                    value=" ".join(role_mentions),
-                    inline=False
-                )
+        embed = self._build_quest_embed(
+            quest,
+            interaction.guild,
+            title=f"Quest Details: {quest.title}",
+            description=f"```\n{quest.description}\n```",
+            summary_fields=[
+                ("■ Status", f"**{_STATUS_TITLES[quest.status]}**"),
+                ("■ Quest Creator", f"**{creator_name}**\n*Created {quest.created_at.strftime('%B %d, %Y')}*")
+            ]
+        )
 
         # Add acceptance info if quest is available
         if quest.status == QuestStatus.AVAILABLE:
-            accept_channel = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
-            if accept_channel:
+            channels = await self.channel_config.get_channels(interaction.guild.id)
+            if channels.quest_accept_channel:
                 embed.add_field(
                     name="How to Accept",
-                    value=f"Use `/accept_quest {quest.quest_id}` in <#{accept_channel}>",
+                    value=f"Use `/accept_quest {quest.quest_id}` in <#{channels.quest_accept_channel}>",
                     inline=False
                 )
 
         embed.set_footer(text=f"Quest ID: {quest.quest_id}")
         embed.timestamp = quest.created_at
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="accept_quest", description="Accept a quest")
     @app_commands.describe(quest_id="The ID of the quest to accept")
     async def accept_quest(self, interaction: discord.Interaction, quest_id: str):
         """Accept a quest"""
+        await interaction.response.defer()
+
         user_role_ids = [role.id for role in interaction.user.roles]
         
-        progress, error = await self.quest_manager.accept_quest(
+        progress, quest, error = await self.quest_manager.accept_quest(
             quest_id, 
             interaction.user.id, 
             user_role_ids, 
@@ -516,65 +675,32 @@ class QuestCommands(commands.Cog):
         )
         
         if error:
-            await interaction.response.send_message(error, ephemeral=True)
-            return
-        
-        quest = await self.quest_manager.get_quest(quest_id)
-        if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
+            await self._reply_private(interaction, error)
             return
 
         # Update user stats
         await self.user_stats_manager.update_quest_accepted(interaction.user.id, interaction.guild.id)
         
-        embed = discord.Embed(
+        embed = self._build_quest_embed(
+            quest,
+            interaction.guild,
             title="Quest Accepted Successfully",
             description=f"You have embarked on the quest **{quest.title}**",
-            color=self._get_rank_color(quest.rank)
+            summary_fields=[
+                ("■ Accepted", f"**{progress.accepted_at.strftime('%B %d, %Y')}**\n*{progress.accepted_at.strftime('%I:%M %p')}*"),
+                ("■ Status", "**In Progress**\n*Quest Active*")
+            ],
+            requirements_name="■ Requirements to Complete",
+            reward_name="■ Reward Upon Completion",
+            show_required_roles=False
         )
         
-        # Quest details section
-        quest_details = f"**Quest ID:** `{quest.quest_id}`\n**Difficulty:** {quest.rank.title()}\n**Category:** {quest.category.title()}"
-        embed.add_field(
-            name="■ Quest Information",
-            value=quest_details,
-            inline=True
-        )
-        
-        # Acceptance info
-        embed.add_field(
-            name="■ Accepted",
-            value=f"**{progress.accepted_at.strftime('%B %d, %Y')}**\n*{progress.accepted_at.strftime('%I:%M %p')}*",
-            inline=True
-        )
-        
-        # Status
-        embed.add_field(
-            name="■ Status",
-            value="**In Progress**\n*Quest Active*",
-            inline=True
-        )
-        
-        if quest.requirements:
-            embed.add_field(
-                name="■ Requirements to Complete",
-                value=f"```yaml\n{quest.requirements}\n```",
-                inline=False
-            )
-        
-        if quest.reward:
-            embed.add_field(
-                name="■ Reward Upon Completion",
-                value=f"```yaml\n{quest.reward}\n```",
-                inline=False
-            )
-        
         # Add submission info
-        submit_channel = await self.channel_config.get_quest_submit_channel(interaction.guild.id)
-        if submit_channel:
+        channels = await self.channel_config.get_channels(interaction.guild.id)
+        if channels.quest_submit_channel:
             embed.add_field(
                 name="■ Next Steps",
-                value=f"Complete the quest requirements and use `/submit_quest {quest.quest_id}` in <#{submit_channel}> to submit your proof.",
+                value=f"Complete the quest requirements and use `/submit_quest {quest.quest_id}` in <#{channels.quest_submit_channel}> to submit your proof.",
                 inline=False
             )
         else:
@@ -587,7 +713,7 @@ class QuestCommands(commands.Cog):
         embed.set_footer(text=f"Quest ID: {quest.quest_id} • Good luck on your adventure!")
         embed.timestamp = progress.accepted_at
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="submit_quest", description="Submit a completed quest")
     @app_commands.describe(
@@ -629,43 +755,41 @@ class QuestCommands(commands.Cog):
                           proof_image14: discord.Attachment = None,
                           proof_image15: discord.Attachment = None):
         """Submit a completed quest"""
+        await interaction.response.defer()
+
         # Check if in correct channel
-        quest_submit_channel_id = await self.channel_config.get_quest_submit_channel(interaction.guild.id)
-        if quest_submit_channel_id and interaction.channel.id != quest_submit_channel_id:
-            submit_channel = interaction.guild.get_channel(quest_submit_channel_id)
+        channels = await self.channel_config.get_channels(interaction.guild.id)
+        if channels.quest_submit_channel and interaction.channel.id != channels.quest_submit_channel:
+            submit_channel = interaction.guild.get_channel(channels.quest_submit_channel)
             if submit_channel:
-                await interaction.response.send_message(
-                    f"Please use {submit_channel.mention} to submit quest completions!",
-                    ephemeral=True
+                await self._reply_private(
+                    interaction,
+                    f"Please use {submit_channel.mention} to submit quest completions!"
                 )
                 return
 
         # Collect all proof images
-        proof_images = [proof_image1, proof_image2, proof_image3, proof_image4, proof_image5,
-                       proof_image6, proof_image7, proof_image8, proof_image9, proof_image10,
-                       proof_image11, proof_image12, proof_image13, proof_image14, proof_image15]
-        proof_image_urls = []
-
-        for image in proof_images:
-            if image:
-                proof_image_urls.append(image.url)
-        
-        progress = await self.quest_manager.complete_quest(
+        proof_image_urls = [
+            image.url for image in (proof_image1, proof_image2, proof_image3, proof_image4, proof_image5,
+                                    proof_image6, proof_image7, proof_image8, proof_image9, proof_image10,
+                                    proof_image11, proof_image12, proof_image13, proof_image14, proof_image15)
+            if image is not None
+        ]
+        
+        progress, quest, error = await self.quest_manager.complete_quest(
             quest_id, 
             interaction.user.id, 
             proof_text, 
             proof_image_urls
         )
         
-        if not progress:
-            await interaction.response.send_message("Quest not found or not in accepted state!", ephemeral=True)
-            return
-        
-        quest = await self.quest_manager.get_quest(quest_id)
-        if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
+        if error:
+            await self._reply_private(interaction, error)
             return
 
+        # Break up triple backticks so the proof can't close its code block early
+        safe_proof_text = proof_text.replace("```", "``\u200b`")
+
         embed = discord.Embed(
             title="Quest Submitted Successfully",
             description=f"Your completion of **{quest.title}** has been submitted for approval.",
@@ -673,7 +797,7 @@ class QuestCommands(commands.Cog):
         )
         
         # Quest details section
-        quest_details = f"**Quest ID:** `{quest.quest_id}`\n**Difficulty:** {quest.rank.title()}\n**Category:** {quest.category.title()}"
+        quest_details = f"**Quest ID:** `{quest.quest_id}`\n**Difficulty:** {quest.rank_display}\n**Category:** {quest.category_display}"
         embed.add_field(
             name="■ Quest Information",
             value=quest_details,
@@ -697,7 +821,7 @@ class QuestCommands(commands.Cog):
         # Proof section
         embed.add_field(
             name="■ Proof of Completion",
-            value=f"```\n{proof_text[:1000] if len(proof_text) > 1000 else proof_text}\n```",
+            value=f"```\n{safe_proof_text[:1000]}\n```",
             inline=False
         )
         
@@ -719,77 +843,86 @@ class QuestCommands(commands.Cog):
         embed.set_footer(text=f"Quest ID: {quest.quest_id} • Submission received and queued for review")
         embed.timestamp = progress.completed_at
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
-        # Send to approval channel and ping quest creator
-        approval_channel_id = await self.channel_config.get_quest_approval_channel(interaction.guild.id)
-        if approval_channel_id:
-            approval_channel = interaction.guild.get_channel(approval_channel_id)
-            creator = interaction.guild.get_member(quest.creator_id)
-            
-            if approval_channel:
-                approval_embed = discord.Embed(
-                    title="Quest Submission Pending Approval",
-                    description=f"**{interaction.user.display_name}** has submitted proof for quest **{quest.title}**",
-                    color=discord.Color.orange()
-                )
-                
-                approval_embed.add_field(
-                    name="■ Quest Details",
-                    value=f"**ID:** `{quest.quest_id}`\n**Rank:** {quest.rank.title()}\n**Category:** {quest.category.title()}",
-                    inline=True
-                )
-                
-                approval_embed.add_field(
-                    name="■ Submitter",
-                    value=f"{interaction.user.mention}\n**User ID:** {interaction.user.id}",
-                    inline=True
-                )
-                
-                approval_embed.add_field(
-                    name="■ Submitted",
-                    value=f"<t:{int(progress.completed_at.timestamp())}:f>",
-                    inline=True
-                )
-                
-                approval_embed.add_field(
-                    name="■ Proof Text",
-                    value=f"```\n{proof_text[:500]}{'...' if len(proof_text) > 500 else ''}\n```",
-                    inline=False
-                )
-                
-                if proof_image_urls:
-                    approval_embed.add_field(
-                        name="■ Images Submitted",
-                        value=f"{len(proof_image_urls)} image(s) attached",
-                        inline=True
-                    )
-                    approval_embed.set_image(url=proof_image_urls[0])
-                
-                approval_embed.add_field(
-                    name="■ Actions",
-                    value=f"Use `/approve_quest {quest.quest_id} {interaction.user.id}` or `/reject_quest {quest.quest_id} {interaction.user.id}`",
-                    inline=False
-                )
-                
-                approval_embed.set_footer(text=f"Quest ID: {quest.quest_id}")
-                approval_embed.timestamp = progress.completed_at
-                
-                # Send with creator ping
-                content = f"{creator.mention if creator else 'Quest Creator'} - New quest submission requires your approval!"
-                await approval_channel.send(content=content, embed=approval_embed)
-                
-                # Send additional images if there are more than one
-                if len(proof_image_urls) > 1:
-                    additional_embed = discord.Embed(
-                        title="Additional Proof Images",
-                        description=f"Additional images for quest `{quest_id}` by {interaction.user.display_name}",
-                        color=discord.Color.blue()
-                    )
-                    for i, url in enumerate(proof_image_urls[1:], 2):
-                        additional_embed.add_field(name=f"Image {i}", value=f"[View Image]({url})", inline=True)
-                    
-                    await approval_channel.send(embed=additional_embed)
+        # Send to approval channel and ping quest creator, skipping the embed work if it isn't configured
+        approval_channel = interaction.guild.get_channel(channels.quest_approval_channel) if channels.quest_approval_channel else None
+        if not approval_channel:
+            return
+        
+        creator = interaction.guild.get_member(quest.creator_id)
+        approval_embed = discord.Embed(
+            title="Quest Submission Pending Approval",
+            description=f"**{interaction.user.display_name}** has submitted proof for quest **{quest.title}**",
+            color=discord.Color.orange()
+        )
+        
+        approval_embed.add_field(
+            name="■ Quest Details",
+            value=quest.details_block,
+            inline=True
+        )
+        
+        approval_embed.add_field(
+            name="■ Submitter",
+            value=f"{interaction.user.mention}\n**User ID:** {interaction.user.id}",
+            inline=True
+        )
+        
+        approval_embed.add_field(
+            name="■ Submitted",
+            value=f"<t:{int(progress.completed_at.timestamp())}:f>",
+            inline=True
+        )
+        
+        truncated_proof = safe_proof_text[:500]
+        ellipsis = "..." if len(safe_proof_text) > 500 else ""
+        approval_embed.add_field(
+            name="■ Proof Text",
+            value=f"```\n{truncated_proof}{ellipsis}\n```",
+            inline=False
+        )
+        
+        if proof_image_urls:
+            approval_embed.add_field(
+                name="■ Images Submitted",
+                value=f"{len(proof_image_urls)} image(s) attached",
+                inline=True
+            )
+            approval_embed.set_image(url=proof_image_urls[0])
+        
+        approval_embed.add_field(
+            name="■ Actions",
+            value=f"Use `/approve_quest {quest.quest_id} {interaction.user.id}` or `/reject_quest {quest.quest_id} {interaction.user.id}`",
+            inline=False
+        )
+        
+        approval_embed.set_footer(text=f"Quest ID: {quest.quest_id}")
+        approval_embed.timestamp = progress.completed_at
+        
+        embeds = [approval_embed]
+        
+        # Attach additional images if there are more than one, as long as both
+        # embeds fit in one message; otherwise they go out as a second message
+        overflow_embed = None
+        if len(proof_image_urls) > 1:
+            additional_embed = discord.Embed(
+                title="Additional Proof Images",
+                description=f"Additional images for quest `{quest_id}` by {interaction.user.display_name}",
+                color=discord.Color.blue()
+            )
+            for i, url in enumerate(proof_image_urls[1:], 2):
+                additional_embed.add_field(name=f"Image {i}", value=f"[View Image]({url})", inline=True)
+            if len(approval_embed) + len(additional_embed) <= _MESSAGE_EMBEDS_MAX_CHARS:
+                embeds.append(additional_embed)
+            else:
+                overflow_embed = additional_embed
+        
+        # Send with creator ping
+        content = f"{creator.mention if creator else 'Quest Creator'} - New quest submission requires your approval!"
+        await approval_channel.send(content=content, embeds=embeds)
+        if overflow_embed is not None:
+            await approval_channel.send(embed=overflow_embed)
 
     @app_commands.command(name="approve_quest", description="Approve a completed quest")
     @app_commands.describe(
@@ -798,22 +931,23 @@ class QuestCommands(commands.Cog):
     )
     async def approve_quest(self, interaction: discord.Interaction, quest_id: str, user: discord.Member):
         """Approve a completed quest"""
-        quest = await self.quest_manager.get_quest(quest_id)
-        if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
-            return
-        
-        if not can_manage_quest(interaction.user, interaction.guild, quest.creator_id):
-            await interaction.response.send_message("You don't have permission to approve this quest!", ephemeral=True)
+        await interaction.response.defer()
+
+        now = discord.utils.utcnow()
+        quest = await self._require_managed_quest(interaction, quest_id, "approve")
+        if quest is None:
             return
         
         progress = await self.quest_manager.approve_quest(quest_id, user.id, True)
         if not progress:
-            await interaction.response.send_message("Quest not found or not in completed state!", ephemeral=True)
+            await self._reply_private(interaction, "Quest not found or not in completed state!")
             return
         
-        # Update user stats
-        await self.user_stats_manager.update_quest_completed(user.id, interaction.guild.id)
+        # Update user stats while resolving the notification channel
+        _, channels = await asyncio.gather(
+            self.user_stats_manager.update_quest_completed(user.id, interaction.guild.id),
+            self.channel_config.get_channels(interaction.guild.id)
+        )
         
         embed = discord.Embed(
             title="Quest Approved",
@@ -823,7 +957,7 @@ class QuestCommands(commands.Cog):
         
         embed.add_field(
             name="Quest Details",
-            value=f"**ID:** `{quest.quest_id}`\n**Rank:** {quest.rank.title()}\n**Category:** {quest.category.title()}",
+            value=quest.details_block,
             inline=True
         )
         
@@ -835,7 +969,7 @@ class QuestCommands(commands.Cog):
         
         embed.add_field(
             name="Approved On",
-            value=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+            value=now.strftime("%B %d, %Y at %I:%M %p UTC"),
             inline=True
         )
         
@@ -847,59 +981,15 @@ class QuestCommands(commands.Cog):
             )
         
         embed.set_footer(text=f"Quest ID: {quest.quest_id}")
-        embed.timestamp = datetime.now()
-
-        await interaction.response.send_message(embed=embed)
-        
-        # Notify the user in quest accept channel
-        quest_accept_channel_id = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
-        quest_accept_channel = interaction.guild.get_channel(quest_accept_channel_id) if quest_accept_channel_id else None
-        
-        user_embed = discord.Embed(
-            title="🎉 Quest Approved!",
-            description=f"Congratulations! Your completion of **{quest.title}** has been approved!",
-            color=discord.Color.green()
-        )
-        
-        user_embed.add_field(
-            name="■ Quest Details",
-            value=f"**ID:** `{quest.quest_id}`\n**Rank:** {quest.rank.title()}\n**Category:** {quest.category.title()}",
-            inline=True
-        )
-        
-        user_embed.add_field(
-            name="■ Approved By",
-            value=f"{interaction.user.mention}\n**{interaction.user.display_name}**",
-            inline=True
-        )
-        
-        user_embed.add_field(
-            name="■ Approved On",
-            value=f"<t:{int(datetime.now().timestamp())}:f>",
-            inline=True
-        )
+        embed.timestamp = now
         
-        if quest.reward:
-            user_embed.add_field(
-                name="■ Your Reward",
-                value=f"```yaml\n{quest.reward}\n```",
-                inline=False
-            )
-        
-        user_embed.add_field(
-            name="■ Congratulations!",
-            value="Well done on completing this quest! Your efforts have been recognized and rewarded.",
-            inline=False
-        )
-        
-        user_embed.set_footer(text=f"Quest ID: {quest.quest_id} • Keep up the great work!")
-        user_embed.timestamp = datetime.now()
+        await interaction.followup.send(embed=embed)
         
-        if quest_accept_channel:
-            await quest_accept_channel.send(content=f"{user.mention} 🎉", embed=user_embed)
-        else:
-            # Fallback to current channel if quest accept channel not set
-            await interaction.followup.send(content=f"{user.mention} 🎉", embed=user_embed)
+        # Notify the user in quest accept channel, falling back to the current channel,
+        # without holding up the handler
+        quest_accept_channel = interaction.guild.get_channel(channels.quest_accept_channel) if channels.quest_accept_channel else None
+        destination = quest_accept_channel or interaction.followup
+        self._run_in_background(self._notify_quest_approved(destination, quest, user, interaction.user, now))
 
     @app_commands.command(name="reject_quest", description="Reject a completed quest")
     @app_commands.describe(
@@ -908,22 +998,23 @@ class QuestCommands(commands.Cog):
     )
     async def reject_quest(self, interaction: discord.Interaction, quest_id: str, user: discord.Member):
         """Reject a completed quest"""
-        quest = await self.quest_manager.get_quest(quest_id)
-        if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
-            return
-        
-        if not can_manage_quest(interaction.user, interaction.guild, quest.creator_id):
-            await interaction.response.send_message("You don't have permission to reject this quest!", ephemeral=True)
+        await interaction.response.defer()
+
+        now = discord.utils.utcnow()
+        quest = await self._require_managed_quest(interaction, quest_id, "reject")
+        if quest is None:
             return
         
         progress = await self.quest_manager.approve_quest(quest_id, user.id, False)
         if not progress:
-            await interaction.response.send_message("Quest not found or not in completed state!", ephemeral=True)
+            await self._reply_private(interaction, "Quest not found or not in completed state!")
             return
         
-        # Update user stats
-        await self.user_stats_manager.update_quest_rejected(user.id, interaction.guild.id)
+        # Update user stats while resolving the notification channel
+        _, channels = await asyncio.gather(
+            self.user_stats_manager.update_quest_rejected(user.id, interaction.guild.id),
+            self.channel_config.get_channels(interaction.guild.id)
+        )
         
         embed = discord.Embed(
             title="Quest Rejected",
@@ -933,7 +1024,7 @@ class QuestCommands(commands.Cog):
         
         embed.add_field(
             name="Quest Details",
-            value=f"**ID:** `{quest.quest_id}`\n**Rank:** {quest.rank.title()}\n**Category:** {quest.category.title()}",
+            value=quest.details_block,
             inline=True
         )
         
@@ -945,7 +1036,7 @@ class QuestCommands(commands.Cog):
         
         embed.add_field(
             name="Rejected On",
-            value=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
+            value=now.strftime("%B %d, %Y at %I:%M %p UTC"),
             inline=True
         )
         
@@ -956,62 +1047,21 @@ class QuestCommands(commands.Cog):
         )
         
         embed.set_footer(text=f"Quest ID: {quest.quest_id}")
-        embed.timestamp = datetime.now()
-
-        await interaction.response.send_message(embed=embed)
-        
-        # Notify the user in quest accept channel
-        quest_accept_channel_id = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
-        quest_accept_channel = interaction.guild.get_channel(quest_accept_channel_id) if quest_accept_channel_id else None
-        
-        user_embed = discord.Embed(
-            title="❌ Quest Rejected",
-            description=f"Your submission for **{quest.title}** has been rejected and requires revision.",
-            color=discord.Color.red()
-        )
-        
-        user_embed.add_field(
-            name="■ Quest Details",
-            value=f"**ID:** `{quest.quest_id}`\n**Rank:** {quest.rank.title()}\n**Category:** {quest.category.title()}",
-            inline=True
-        )
+        embed.timestamp = now
         
-        user_embed.add_field(
-            name="■ Rejected By",
-            value=f"{interaction.user.mention}\n**{interaction.user.display_name}**",
-            inline=True
-        )
-        
-        user_embed.add_field(
-            name="■ Rejected On",
-            value=f"<t:{int(datetime.now().timestamp())}:f>",
-            inline=True
-        )
-        
-        user_embed.add_field(
-            name="■ What's Next",
-            value="• Review the quest requirements carefully\n• You can attempt this quest again after 24 hours\n• Make sure your proof meets all the specified criteria\n• Contact the quest creator if you need clarification",
-            inline=False
-        )
-        
-        user_embed.add_field(
-            name="■ Don't Give Up!",
-            value="Learning from feedback is part of the adventure. Use this as an opportunity to improve and try again!",
-            inline=False
-        )
-        
-        user_embed.set_footer(text=f"Quest ID: {quest.quest_id} • Try again in 24 hours")
-        user_embed.timestamp = datetime.now()
+        await interaction.followup.send(embed=embed)
         
-        if quest_accept_channel:
-            await quest_accept_channel.send(content=f"{user.mention} 📋", embed=user_embed)
-        else:
-            # Fallback to current channel if quest accept channel not set
-            await interaction.followup.send(content=f"{user.mention} 📋", embed=user_embed)
+        # Notify the user in quest accept channel, falling back to the current channel,
+        # without holding up the handler
+        quest_accept_channel = interaction.guild.get_channel(channels.quest_accept_channel) if channels.quest_accept_channel else None
+        destination = quest_accept_channel or interaction.followup
+        self._run_in_background(self._notify_quest_rejected(destination, quest, user, interaction.user, now))
 
     @app_commands.command(name="my_quests", description="View your quest progress")
     async def my_quests(self, interaction: discord.Interaction):
         """View user's quest progress"""
+        await interaction.response.defer()
+
         user_quests = await self.quest_manager.get_user_quests(interaction.user.id, interaction.guild.id)
         
         if not user_quests:
@@ -1025,7 +1075,7 @@ class QuestCommands(commands.Cog):
                 value="• Use `/list_quests` to see available quests\n• Use `/quest_info <quest_id>` to view quest details\n• Use `/accept_quest <quest_id>` to begin your journey",
                 inline=False
             )
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
             return
 
         embed = discord.Embed(
@@ -1034,24 +1084,30 @@ class QuestCommands(commands.Cog):
             color=discord.Color.blue()
         )
 
-        # Group by status
-        status_groups = {}
-        for progress in user_quests:
-            status = progress.status
-            if status not in status_groups:
-                status_groups[status] = []
-            status_groups[status].append(progress)
+        # Group by status; sorted() is stable, so each group keeps the newest-first order
+        status_groups = {
+            status: list(group)
+            for status, group in groupby(sorted(user_quests, key=_STATUS_KEY), key=_STATUS_KEY)
+        }
+
+        # Fetch every quest shown (up to 5 per status) in one query
+        quests_by_id = await self.quest_manager.get_quests_by_ids(
+            list({progress.quest_id for quests in status_groups.values() for progress in quests[:5]})
+        )
 
-        # Display each status group with better formatting
-        for status, quests in status_groups.items():
+        # Display each status group with better formatting, in workflow order
+        ordered_statuses = [status for status in _PROGRESS_STATUS_ORDER if status in status_groups]
+        ordered_statuses += [status for status in status_groups if status not in _PROGRESS_STATUS_ORDER]
+        for status in ordered_statuses:
+            quests = status_groups[status]
             quest_list = []
             for progress in quests[:5]:  # Limit to 5 per status
-                quest = await self.quest_manager.get_quest(progress.quest_id)
+                quest = quests_by_id.get(progress.quest_id)
                 if quest:
                     quest_list.append(f"• `{quest.quest_id}` **{quest.title}**")
             
             if quest_list:
-                status_title = f"■ {status.title()} Quests"
+                status_title = f"■ {_STATUS_TITLES[status]} Quests"
                 if len(quests) > 5:
                     status_title += f" ({len(quests)} total, showing first 5)"
                 else:
@@ -1067,9 +1123,8 @@ class QuestCommands(commands.Cog):
         stats = await self.user_stats_manager.get_user_stats(interaction.user.id, interaction.guild.id)
         
         # Calculate success rate
-        success_rate = 0
-        if stats.quests_accepted > 0:
-            success_rate = (stats.quests_completed / stats.quests_accepted) * 100
+        accepted = stats.quests_accepted
+        success_rate = 100.0 * stats.quests_completed / accepted if accepted else 0.0
         
         stats_text = f"**Quests Completed:** {stats.quests_completed}\n**Quests Accepted:** {stats.quests_accepted}\n**Success Rate:** {success_rate:.1f}%\n**Rejected:** {stats.quests_rejected}"
         
@@ -1080,14 +1135,16 @@ class QuestCommands(commands.Cog):
         )
 
         embed.set_footer(text="Use /quest_info <quest_id> to view details • Use /leaderboard to see server rankings")
-        embed.timestamp = datetime.now()
+        embed.timestamp = discord.utils.utcnow()
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="leaderboard", description="View the quest leaderboard")
     @app_commands.describe(limit="Number of users to show (default: 10)")
     async def leaderboard(self, interaction: discord.Interaction, limit: int = 10):
         """View the quest leaderboard"""
+        await interaction.response.defer()
+
         if limit > 25:
             limit = 25
         if limit < 1:
@@ -1106,7 +1163,7 @@ class QuestCommands(commands.Cog):
                 value="• Use `/list_quests` to see available quests\n• Complete quests to earn your place on the leaderboard\n• Compete with other adventurers for the top position",
                 inline=False
             )
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
             return
 
         embed = discord.Embed(
@@ -1115,27 +1172,27 @@ class QuestCommands(commands.Cog):
             color=discord.Color.gold()
         )
 
-        leaderboard_text = ""
-        for i, stats in enumerate(leaderboard, 1):
-            user = interaction.guild.get_member(stats.user_id)
-            username = user.display_name if user else "Unknown User"
-            
-            # Add ranking indicator for top 3
-            if i == 1:
-                rank_indicator = "**[CHAMPION]**"
-            elif i == 2:
-                rank_indicator = "**[ELITE]**"
-            elif i == 3:
-                rank_indicator = "**[VETERAN]**"
-            else:
-                rank_indicator = f"**#{i}**"
-            
-            completion_rate = 0
-            if stats.quests_accepted > 0:
-                completion_rate = (stats.quests_completed / stats.quests_accepted) * 100
-            
-            leaderboard_text += f"{rank_indicator} **{username}**\n"
-            leaderboard_text += f"```yaml\nCompleted: {stats.quests_completed} | Success Rate: {completion_rate:.1f}%\n```"
+        # Rates, names and place labels up front so the join below only formats
+        completion_rates = [
+            100.0 * stats.quests_completed / stats.quests_accepted if stats.quests_accepted else 0.0
+            for stats in leaderboard
+        ]
+        get_member = interaction.guild.get_member
+        usernames = [
+            member.display_name if member else "Unknown User"
+            for member in (get_member(stats.user_id) for stats in leaderboard)
+        ]
+        # Named labels for the top 3, then "#n"
+        rank_indicators = _RANK_INDICATORS + tuple(
+            f"**#{i}**" for i in range(len(_RANK_INDICATORS) + 1, len(leaderboard) + 1)
+        )
+
+        leaderboard_text = "".join(
+            f"{rank_indicator} **{username}**\n"
+            f"```yaml\nCompleted: {stats.quests_completed} | Success Rate: {completion_rate:.1f}%\n```"
+            for stats, username, rank_indicator, completion_rate
+            in zip(leaderboard, usernames, rank_indicators, completion_rates)
+        )
 
         embed.add_field(
             name="■ Quest Champions",
@@ -1154,21 +1211,16 @@ class QuestCommands(commands.Cog):
         )
 
         embed.set_footer(text="Use /my_quests to see your personal progress • Rankings updated in real-time")
-        embed.timestamp = datetime.now()
+        embed.timestamp = discord.utils.utcnow()
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="delete_quest", description="Delete a quest (quest creators only)")
     @app_commands.describe(quest_id="The ID of the quest to delete")
     async def delete_quest(self, interaction: discord.Interaction, quest_id: str):
         """Delete a quest"""
-        quest = await self.quest_manager.get_quest(quest_id)
-        if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
-            return
-        
-        if not can_manage_quest(interaction.user, interaction.guild, quest.creator_id):
-            await interaction.response.send_message("You don't have permission to delete this quest!", ephemeral=True)
+        quest = await self._require_managed_quest(interaction, quest_id, "delete")
+        if quest is None:
             return
         
         success = await self.quest_manager.delete_quest(quest_id)
@@ -1180,7 +1232,7 @@ class QuestCommands(commands.Cog):
             )
             embed.add_field(
                 name="Quest Details",
-                value=f"**ID:** `{quest.quest_id}`\n**Rank:** {quest.rank.title()}\n**Category:** {quest.category.title()}",
+                value=quest.details_block,
                 inline=True
             )
             embed.add_field(
@@ -1189,7 +1241,7 @@ class QuestCommands(commands.Cog):
                 inline=True
             )
             embed.set_footer(text="This action cannot be undone")
-            embed.timestamp = datetime.now()
+            embed.timestamp = discord.utils.utcnow()
             
             await interaction.response.send_message(embed=embed)
         else:
@@ -1198,55 +1250,12 @@ class QuestCommands(commands.Cog):
     @app_commands.command(name="help", description="Get help with quest commands")
     async def help_command(self, interaction: discord.Interaction):
         """Get help with quest commands"""
-        embed = discord.Embed(
-            title="Quest Bot Command Guide",
-            description="**Complete guide to managing quests in your server**",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="■ Server Setup",
-            value="```yaml\n/setup_channels - Configure quest channels for your server\n```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="■ Quest Creation & Management",
-            value="```yaml\n/create_quest - Create a new quest\n/delete_quest - Delete a quest (creators only)\n```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="■ Quest Participation",
-            value="```yaml\n/list_quests - View available quests\n/quest_info - Get detailed quest information\n/accept_quest - Accept a quest\n/submit_quest - Submit completed quest\n```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="■ Quest Review",
-            value="```yaml\n/approve_quest - Approve a completed quest\n/reject_quest - Reject a completed quest\n```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="■ Progress & Statistics",
-            value="```yaml\n/my_quests - View your quest progress\n/leaderboard - View server leaderboard\n```",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="■ Quest Difficulty Levels",
-            value="**Easy** → **Normal** → **Medium** → **Hard** → **Impossible**",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="■ Available Categories",
-            value="**Hunting** • **Gathering** • **Collecting** • **Crafting**\n**Exploration** • **Combat** • **Social** • **Building**\n**Trading** • **Puzzle** • **Survival** • **Other**",
-            inline=True
-        )
-        
-        embed.set_footer(text="Need additional help? Contact your server administrators • Bot developed for quest management")
-        embed.timestamp = datetime.now()
+        # Embed.from_dict keeps references, so hand it fresh field and footer dicts to mutate
+        embed = discord.Embed.from_dict({
+            **_HELP_EMBED_DICT,
+            "fields": [dict(f) for f in _HELP_EMBED_DICT["fields"]],
+            "footer": dict(_HELP_EMBED_DICT["footer"])
+        })
+        embed.timestamp = discord.utils.utcnow()
         
         await interaction.response.send_message(embed=embed)
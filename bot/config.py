@@ -1,14 +1,32 @@
 
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from bot.sql_database import SQLDatabase
 from bot.models import ChannelConfig as ChannelConfigModel
 
 
+@dataclass(slots=True)
+class ChannelSet:
+    """Configured channel IDs for a guild, slotted since one is read on every command"""
+    quest_list_channel: Optional[int] = None
+    quest_accept_channel: Optional[int] = None
+    quest_submit_channel: Optional[int] = None
+    quest_approval_channel: Optional[int] = None
+    notification_channel: Optional[int] = None
+
+
 class ChannelConfig:
     """Manages channel configuration for guilds"""
     
+    # Seconds a cached guild config is trusted before it is reloaded
+    CACHE_TTL = 300
+    
     def __init__(self, database: SQLDatabase):
         self.database = database
+        # Write-through cache of (expires_at, channels); entries also expire so
+        # changes made outside this process are eventually picked up
+        self._cache: Dict[int, Tuple[float, ChannelSet]] = {}
     
     async def initialize(self):
         """Initialize the channel config manager"""
@@ -28,32 +46,57 @@ class ChannelConfig:
             notification_channel=notification_channel
         )
         await self.database.save_channel_config(config)
+        self._cache[guild_id] = (time.monotonic() + self.CACHE_TTL, ChannelSet(
+            quest_list_channel=quest_list_channel,
+            quest_accept_channel=quest_accept_channel,
+            quest_submit_channel=quest_submit_channel,
+            quest_approval_channel=quest_approval_channel,
+            notification_channel=notification_channel
+        ))
     
     async def get_guild_config(self, guild_id: int) -> Optional[ChannelConfigModel]:
         """Get channel configuration for a guild"""
         return await self.database.get_channel_config(guild_id)
     
+    async def get_channels(self, guild_id: int) -> ChannelSet:
+        """Get all configured channels for a guild, loading from the database when not cached"""
+        now = time.monotonic()
+        cached = self._cache.get(guild_id)
+        if cached is not None and cached[0] > now:
+            channels = cached[1]
+        else:
+            config = await self.get_guild_config(guild_id)
+            if config:
+                channels = ChannelSet(
+                    quest_list_channel=config.quest_list_channel,
+                    quest_accept_channel=config.quest_accept_channel,
+                    quest_submit_channel=config.quest_submit_channel,
+                    quest_approval_channel=config.quest_approval_channel,
+                    notification_channel=config.notification_channel
+                )
+            else:
+                channels = ChannelSet()
+            # Don't overwrite an entry set_guild_channels wrote while the load was in flight
+            if self._cache.get(guild_id) is cached:
+                self._cache[guild_id] = (now + self.CACHE_TTL, channels)
+        return channels
+    
     async def get_quest_list_channel(self, guild_id: int) -> Optional[int]:
         """Get quest list channel for a guild"""
-        config = await self.get_guild_config(guild_id)
-        return config.quest_list_channel if config else None
+        return (await self.get_channels(guild_id)).quest_list_channel
     
     async def get_quest_accept_channel(self, guild_id: int) -> Optional[int]:
         """Get quest accept channel for a guild"""
-        config = await self.get_guild_config(guild_id)
-        return config.quest_accept_channel if config else None
+        return (await self.get_channels(guild_id)).quest_accept_channel
     
     async def get_quest_submit_channel(self, guild_id: int) -> Optional[int]:
         """Get quest submit channel for a guild"""
-        config = await self.get_guild_config(guild_id)
-        return config.quest_submit_channel if config else None
+        return (await self.get_channels(guild_id)).quest_submit_channel
     
     async def get_quest_approval_channel(self, guild_id: int) -> Optional[int]:
         """Get quest approval channel for a guild"""
-        config = await self.get_guild_config(guild_id)
-        return config.quest_approval_channel if config else None
+        return (await self.get_channels(guild_id)).quest_approval_channel
     
     async def get_notification_channel(self, guild_id: int) -> Optional[int]:
         """Get notification channel for a guild"""
-        config = await self.get_guild_config(guild_id)
-        return config.notification_channel if config else None
+        return (await self.get_channels(guild_id)).notification_channel
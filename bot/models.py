@@ -1,6 +1,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 
 
@@ -62,6 +63,18 @@ class Quest:
     status: str = QuestStatus.AVAILABLE
     created_at: datetime = field(default_factory=datetime.now)
     required_role_ids: List[int] = field(default_factory=list)
+    # Display forms of rank and category, derived once at construction
+    rank_display: str = field(default="", init=False, repr=False, compare=False)
+    category_display: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rank_display = self.rank.title()
+        self.category_display = self.category.title()
+
+    @cached_property
+    def details_block(self) -> str:
+        """ID, rank and category summary used in quest embeds"""
+        return f"**ID:** `{self.quest_id}`\n**Rank:** {self.rank_display}\n**Category:** {self.category_display}"
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -209,21 +222,21 @@ class UserStats:
 class ChannelConfig:
     """Channel configuration data model"""
     guild_id: int
-    quest_list_channel_id: Optional[int] = None
-    quest_accept_channel_id: Optional[int] = None
-    quest_submit_channel_id: Optional[int] = None
-    quest_approval_channel_id: Optional[int] = None
-    notification_channel_id: Optional[int] = None
+    quest_list_channel: Optional[int] = None
+    quest_accept_channel: Optional[int] = None
+    quest_submit_channel: Optional[int] = None
+    quest_approval_channel: Optional[int] = None
+    notification_channel: Optional[int] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
         return {
             "guild_id": self.guild_id,
-            "quest_list_channel_id": self.quest_list_channel_id,
-            "quest_accept_channel_id": self.quest_accept_channel_id,
-            "quest_submit_channel_id": self.quest_submit_channel_id,
-            "quest_approval_channel_id": self.quest_approval_channel_id,
-            "notification_channel_id": self.notification_channel_id
+            "quest_list_channel": self.quest_list_channel,
+            "quest_accept_channel": self.quest_accept_channel,
+            "quest_submit_channel": self.quest_submit_channel,
+            "quest_approval_channel": self.quest_approval_channel,
+            "notification_channel": self.notification_channel
         }
 
     @classmethod
@@ -231,9 +244,9 @@ class ChannelConfig:
         """Create from dictionary"""
         return cls(
             guild_id=data["guild_id"],
-            quest_list_channel_id=data.get("quest_list_channel_id"),
-            quest_accept_channel_id=data.get("quest_accept_channel_id"),
-            quest_submit_channel_id=data.get("quest_submit_channel_id"),
-            quest_approval_channel_id=data.get("quest_approval_channel_id"),
-            notification_channel_id=data.get("notification_channel_id")
+            quest_list_channel=data.get("quest_list_channel"),
+            quest_accept_channel=data.get("quest_accept_channel"),
+            quest_submit_channel=data.get("quest_submit_channel"),
+            quest_approval_channel=data.get("quest_approval_channel"),
+            notification_channel=data.get("notification_channel")
         )
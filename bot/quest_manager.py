@@ -1,5 +1,5 @@
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import uuid
 from bot.sql_database import SQLDatabase
@@ -43,41 +43,51 @@ class QuestManager:
         """Get a quest by ID"""
         return await self.database.get_quest(quest_id)
     
-    async def get_available_quests(self, guild_id: int) -> List[Quest]:
-        """Get all available quests for a guild"""
-        return await self.database.get_guild_quests(guild_id, QuestStatus.AVAILABLE)
+    async def get_quests_by_ids(self, quest_ids: List[str]) -> Dict[str, Quest]:
+        """Get several quests by ID, keyed by quest ID"""
+        if not quest_ids:
+            return {}
+        quests = await self.database.get_quests_by_ids(quest_ids)
+        return {quest.quest_id: quest for quest in quests}
     
-    async def get_guild_quests(self, guild_id: int) -> List[Quest]:
-        """Get all quests for a guild"""
-        return await self.database.get_guild_quests(guild_id)
+    async def get_available_quests(self, guild_id: int, rank: str = None, category: str = None,
+                                   limit: int = None) -> List[Quest]:
+        """Get available quests for a guild, optionally filtered by rank and category"""
+        return await self.database.get_guild_quests(guild_id, QuestStatus.AVAILABLE,
+                                                    rank=rank, category=category, limit=limit)
+    
+    async def get_guild_quests(self, guild_id: int, rank: str = None, category: str = None,
+                               limit: int = None) -> List[Quest]:
+        """Get all quests for a guild, optionally filtered by rank and category"""
+        return await self.database.get_guild_quests(guild_id, rank=rank, category=category, limit=limit)
     
     async def accept_quest(self, quest_id: str, user_id: int, user_role_ids: List[int], 
-                          channel_id: int) -> Tuple[Optional[QuestProgress], Optional[str]]:
+                          channel_id: int) -> Tuple[Optional[QuestProgress], Optional[Quest], Optional[str]]:
         """Accept a quest"""
         quest = await self.get_quest(quest_id)
         if not quest:
-            return None, "Quest not found!"
+            return None, None, "Quest not found!"
         
         if quest.status != QuestStatus.AVAILABLE:
-            return None, "Quest is not available for acceptance!"
+            return None, quest, "Quest is not available for acceptance!"
         
         # Check if user already has this quest
         existing_progress = await self.database.get_user_quest_progress(user_id, quest_id)
         if existing_progress:
             if existing_progress.status in [ProgressStatus.ACCEPTED, ProgressStatus.COMPLETED]:
-                return None, "You have already accepted this quest!"
+                return None, quest, "You have already accepted this quest!"
             elif existing_progress.status == ProgressStatus.REJECTED:
                 # Check if 24 hours have passed since rejection
                 if existing_progress.completed_at:
                     time_since_rejection = datetime.now() - existing_progress.completed_at
                     if time_since_rejection < timedelta(hours=24):
                         hours_left = 24 - int(time_since_rejection.total_seconds() / 3600)
-                        return None, f"You must wait {hours_left} more hours before attempting this quest again!"
+                        return None, quest, f"You must wait {hours_left} more hours before attempting this quest again!"
         
         # Check role requirements
         if quest.required_role_ids:
             if not any(role_id in user_role_ids for role_id in quest.required_role_ids):
-                return None, "You don't have the required roles for this quest!"
+                return None, quest, "You don't have the required roles for this quest!"
         
         # Create progress entry
         progress = QuestProgress(
@@ -90,14 +100,18 @@ class QuestManager:
         )
         
         await self.database.save_quest_progress(progress)
-        return progress, None
+        return progress, quest, None
     
     async def complete_quest(self, quest_id: str, user_id: int, proof_text: str, 
-                           proof_image_urls: List[str]) -> Optional[QuestProgress]:
+                           proof_image_urls: List[str]) -> Tuple[Optional[QuestProgress], Optional[Quest], Optional[str]]:
         """Complete a quest (submit proof)"""
         progress = await self.database.get_user_quest_progress(user_id, quest_id)
         if not progress or progress.status != ProgressStatus.ACCEPTED:
-            return None
+            return None, None, "Quest not found or not in accepted state!"
+        
+        quest = await self.get_quest(quest_id)
+        if not quest:
+            return None, None, "Quest not found!"
         
         progress.status = ProgressStatus.COMPLETED
         progress.completed_at = datetime.now()
@@ -105,7 +119,7 @@ class QuestManager:
         progress.proof_image_urls = proof_image_urls
         
         await self.database.save_quest_progress(progress)
-        return progress
+        return progress, quest, None
     
     async def approve_quest(self, quest_id: str, user_id: int, approved: bool) -> Optional[QuestProgress]:
         """Approve or reject a completed quest"""
@@ -7,6 +7,24 @@ from datetime import datetime
 from bot.models import Quest, QuestProgress, UserStats, ChannelConfig as ChannelConfigModel
 
 
+def _row_to_quest(row) -> Quest:
+    """Build a Quest from a row of the quests table"""
+    return Quest(
+        quest_id=row['quest_id'],
+        title=row['title'],
+        description=row['description'],
+        creator_id=row['creator_id'],
+        guild_id=row['guild_id'],
+        requirements=row['requirements'] or '',
+        reward=row['reward'] or '',
+        rank=row['rank'] or 'normal',
+        category=row['category'] or 'other',
+        status=row['status'] or 'available',
+        created_at=row['created_at'],
+        required_role_ids=list(row['required_role_ids']) if row['required_role_ids'] else []
+    )
+
+
 class SQLDatabase:
     """PostgreSQL database interface for the quest bot"""
 
@@ -60,6 +78,12 @@ class SQLDatabase:
                 )
             ''')
 
+            # Covers the quest board filters and its newest-first ordering
+            await conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_quests_board
+                ON quests (guild_id, status, rank, category, created_at DESC)
+            ''')
+
             # Quest progress table
             await conn.execute('''
                 CREATE TABLE IF NOT EXISTS quest_progress (
@@ -137,54 +161,33 @@ class SQLDatabase:
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow('SELECT * FROM quests WHERE quest_id = $1', quest_id)
             if row:
-                return Quest(
-                    quest_id=row['quest_id'],
-                    title=row['title'],
-                    description=row['description'],
-                    creator_id=row['creator_id'],
-                    guild_id=row['guild_id'],
-                    requirements=row['requirements'] or '',
-                    reward=row['reward'] or '',
-                    rank=row['rank'] or 'normal',
-                    category=row['category'] or 'other',
-                    status=row['status'] or 'available',
-                    created_at=row['created_at'],
-                    required_role_ids=list(row['required_role_ids']) if row['required_role_ids'] else []
-                )
+                return _row_to_quest(row)
         return None
 
-    async def get_guild_quests(self, guild_id: int, status: str = None) -> List[Quest]:
-        """Get all quests for a guild, optionally filtered by status"""
+    async def get_quests_by_ids(self, quest_ids: List[str]) -> List[Quest]:
+        """Get several quests by ID in a single query"""
         async with self.pool.acquire() as conn:
-            if status:
-                rows = await conn.fetch(
-                    'SELECT * FROM quests WHERE guild_id = $1 AND status = $2 ORDER BY created_at DESC',
-                    guild_id, status
-                )
-            else:
-                rows = await conn.fetch(
-                    'SELECT * FROM quests WHERE guild_id = $1 ORDER BY created_at DESC',
-                    guild_id
-                )
-            
-            quests = []
-            for row in rows:
-                quest = Quest(
-                    quest_id=row['quest_id'],
-                    title=row['title'],
-                    description=row['description'],
-                    creator_id=row['creator_id'],
-                    guild_id=row['guild_id'],
-                    requirements=row['requirements'] or '',
-                    reward=row['reward'] or '',
-                    rank=row['rank'] or 'normal',
-                    category=row['category'] or 'other',
-                    status=row['status'] or 'available',
-                    created_at=row['created_at'],
-                    required_role_ids=list(row['required_role_ids']) if row['required_role_ids'] else []
-                )
-                quests.append(quest)
-            return quests
+            rows = await conn.fetch('SELECT * FROM quests WHERE quest_id = ANY($1::varchar[])', quest_ids)
+            return [_row_to_quest(row) for row in rows]
+
+    async def get_guild_quests(self, guild_id: int, status: str = None, rank: str = None,
+                               category: str = None, limit: int = None) -> List[Quest]:
+        """Get all quests for a guild, optionally filtered by status, rank and category"""
+        conditions = ['guild_id = $1']
+        args = [guild_id]
+        for column, value in (('status', status), ('rank', rank), ('category', category)):
+            if value:
+                args.append(value)
+                conditions.append(f'{column} = ${len(args)}')
+
+        query = f'SELECT * FROM quests WHERE {" AND ".join(conditions)} ORDER BY created_at DESC'
+        if limit:
+            args.append(limit)
+            query += f' LIMIT ${len(args)}'
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *args)
+            return [_row_to_quest(row) for row in rows]
 
     async def delete_quest(self, quest_id: str):
         """Delete a quest and all associated progress"""